@@ -0,0 +1,161 @@
+import os
+import tempfile
+import threading
+import time
+import orjson
+import requests
+from packaging.utils import canonicalize_name
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import quote
+from typing import Dict, Any, Optional, Tuple
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+}
+# PyPI asks API clients to identify themselves instead of posing as a browser.
+PYPI_API_HEADERS = {
+    "User-Agent": "package-analyzer (+https://github.com/achrafaitmbarek/package-analyzer)",
+    "Accept": "application/json",
+}
+
+
+def create_session() -> requests.Session:
+    """Create a pooled session with retries for PyPI, OSV and GitHub requests."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]
+        ),
+    )
+    session.mount("https://", adapter)
+    session.headers.update(DEFAULT_HEADERS)
+    return session
+
+
+SESSION = create_session()
+
+_PYPI_CACHE_DIR = os.path.expanduser("~/.cache/package-analyzer/pypi-json")
+
+# Parsed documents are kept for the life of the process, keyed by canonical
+# name and session; each key has its own lock so concurrent callers asking for
+# the same package share one request while different packages load in parallel.
+_pypi_json_cache: Dict[Tuple[str, requests.Session], Dict[str, Any]] = {}
+_pypi_json_locks: Dict[Tuple[str, requests.Session], threading.Lock] = {}
+_pypi_json_locks_guard = threading.Lock()
+
+
+def fetch_pypi_json(
+    package_name: str,
+    session: Optional[requests.Session] = None,
+    max_age: float = 0,
+) -> Dict[str, Any]:
+    """
+    Fetch the PyPI JSON metadata for a package, at most once per session.
+
+    This is the only PyPI JSON cache: the scraper, the issue tracker and the
+    dependency graph all read through it, so a package is downloaded once per
+    run however many of them ask. Names are normalised with
+    ``canonicalize_name``, and requests go through ``session`` (the shared
+    session when omitted).
+
+    Documents are also kept on disk without the release history and long
+    description. An on-disk copy younger than ``max_age`` seconds is used as
+    is; older copies are revalidated with ETag/Last-Modified, which costs one
+    round trip and no body when nothing changed. Callers must treat the
+    returned dict as read-only.
+    """
+    key = (canonicalize_name(package_name), session or SESSION)
+    with _pypi_json_locks_guard:
+        lock = _pypi_json_locks.setdefault(key, threading.Lock())
+    with lock:
+        if key not in _pypi_json_cache:
+            _pypi_json_cache[key] = _load_pypi_json(*key, max_age)
+        return _pypi_json_cache[key]
+
+
+def _load_pypi_json(
+    package_name: str, session: requests.Session, max_age: float
+) -> Dict[str, Any]:
+    entry = _read_cache(package_name)
+    if entry is not None and time.time() - entry["fetched_at"] <= max_age:
+        return entry["body"]
+
+    headers = dict(PYPI_API_HEADERS)
+    if entry is not None:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    response = session.get(
+        f"https://pypi.org/pypi/{package_name}/json", headers=headers, timeout=10
+    )
+    if entry is not None and response.status_code == 304:
+        entry["fetched_at"] = time.time()
+        _write_cache(package_name, entry)
+        return entry["body"]
+
+    response.raise_for_status()
+    info = orjson.loads(response.content)["info"]
+    # Nothing reads the release history or the README, and they make up most
+    # of the document.
+    body = {"info": {k: v for k, v in info.items() if k != "description"}}
+    _write_cache(
+        package_name,
+        {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "body": body,
+            "fetched_at": time.time(),
+        },
+    )
+    return body
+
+
+def _cache_path(package_name: str) -> str:
+    return os.path.join(_PYPI_CACHE_DIR, f"{quote(package_name, safe='')}.json")
+
+
+def _read_cache(package_name: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(_cache_path(package_name), "rb") as f:
+            entry = orjson.loads(f.read())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or "body" not in entry or "fetched_at" not in entry:
+        return None
+    return entry
+
+
+def _write_cache(package_name: str, entry: Dict[str, Any]) -> None:
+    write_cache_file(_cache_path(package_name), orjson.dumps(entry))
+
+
+def write_cache_file(path: str, data: bytes) -> None:
+    """
+    Best-effort atomic write of a cache file.
+
+    The data goes to a temporary file in the same directory and is then
+    renamed into place, so concurrent runs never read a partial file. Errors
+    are ignored, and the temporary file is removed if the rename never happens.
+    """
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
@@ -1,15 +1,11 @@
 import typer
 from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
 from rich.console import Console
 from . import scraper
 from . import utils
-from . import visualizer
-from .security_analyzer import SecurityAnalyzer
-from .issue_tracker import IssueTracker, display_issue_analysis
 
 console = Console()
-security_analyzer = SecurityAnalyzer()
-issue_tracker = IssueTracker()
 
 
 def main(
@@ -27,6 +23,12 @@ def main(
     depth: int = typer.Option(
         2, "--depth", "-d", help="Maximum depth for dependency graph"
     ),
+    max_nodes: int = typer.Option(
+        200,
+        "--max-nodes",
+        min=1,
+        help="Maximum number of packages in dependency graph",
+    ),
     graph_format: str = typer.Option(
         "png", "--graph-format", help="Graph output format (pdf, png, svg)"
     ),
@@ -38,28 +40,52 @@ def main(
     """Analyze dependencies, security, and issues for a Python package."""
     try:
         console.print(f"[green]Analyzing package: {package_name}...[/green]")
-        package_data = scraper.fetch_package_info(package_name, version)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            package_future = executor.submit(
+                scraper.fetch_package_info, package_name, version
+            )
+            if security:
+                from .security_analyzer import SecurityAnalyzer
+
+                security_future = executor.submit(
+                    SecurityAnalyzer().analyze_package, package_name, version
+                )
+            if issues:
+                from .issue_tracker import IssueTracker, display_issue_analysis
+
+                issue_future = executor.submit(
+                    IssueTracker().analyze_issues, package_name
+                )
 
-        if format == "table":
-            utils.display_table(package_data)
-        elif format == "json":
-            utils.display_json(package_data)
+            package_data = package_future.result()
 
-        if security:
-            console.print(f"\n[green]Performing security analysis...[/green]")
-            security_data = security_analyzer.analyze_package(package_name, version)
-            utils.display_security_report(security_data)
+            if format == "table":
+                utils.display_table(package_data)
+            elif format == "json":
+                utils.display_json(package_data)
 
-        if issues:
-            console.print(f"\n[green]Analyzing GitHub issues...[/green]")
-            issue_data = issue_tracker.analyze_issues(package_name)
-            display_issue_analysis(issue_data)
+            if security:
+                console.print(f"\n[green]Security analysis:[/green]")
+                utils.display_security_report(security_future.result())
+
+            if issues:
+                console.print(f"\n[green]GitHub issue analysis:[/green]")
+                display_issue_analysis(issue_future.result())
 
         if graph:
+            from . import visualizer
+
             console.print(f"\n[green]Generating dependency graph...[/green]")
-            graph_file = visualizer.save_dependency_graph(
-                package_name, max_depth=depth, output_format=graph_format
-            )
+            with console.status("Fetching dependency metadata...") as status:
+                graph_file = visualizer.save_dependency_graph(
+                    package_name,
+                    max_depth=depth,
+                    output_format=graph_format,
+                    max_nodes=max_nodes,
+                    progress_callback=lambda done, queued: status.update(
+                        f"Fetched {done} packages, {queued} queued..."
+                    ),
+                )
             console.print(f"[green]Dependency graph saved as: {graph_file}[/green]")
 
         if save:
@@ -1,51 +1,70 @@
 import requests
 from bs4 import BeautifulSoup
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from rich.console import Console
 from rich.table import Table
 import re
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from ._http import SESSION, fetch_pypi_json
+
+_ISSUE_ROW_RE = re.compile(r"^IssueRow-")
+_MARKDOWN_TITLE_RE = re.compile(r"^markdown-title")
 
 
 class IssueTracker:
-    def __init__(self):
-        self.headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-        }
-        self.console = Console()
+    def __init__(self, session: Optional[requests.Session] = None):
+        self.session = session or SESSION
 
     def analyze_issues(self, package_name: str) -> Dict[str, Any]:
-        """Analyze GitHub issues for a given package."""
-        repo_info = self._get_repo_from_pypi(package_name)
+        """
+        Analyze GitHub issues for a given package.
+
+        This runs alongside the package lookup, so nothing is printed here:
+        status and error lines are returned under ``"notes"`` and shown by
+        ``display_issue_analysis``.
+        """
+        notes: List[str] = []
+        repo_info = self._get_repo_from_pypi(package_name, notes)
         if not repo_info:
             repo_info = self._search_github_repo(package_name)
 
         if not repo_info:
-            return {"error": f"Could not find GitHub repository for {package_name}"}
-
-        self.console.print(f"[green]Found repository: {repo_info['url']}[/green]")
-
-        main_stats = self._get_repo_stats(repo_info["url"])
+            return {
+                "error": f"Could not find GitHub repository for {package_name}",
+                "notes": notes,
+            }
+
+        notes.append(f"[green]Found repository: {repo_info['url']}[/green]")
+
+        # Each task gets its own notes list so the lines are merged in a fixed
+        # order rather than the order the threads happen to finish in.
+        url = repo_info["url"]
+        stats_notes: List[str] = []
+        recent_notes: List[str] = []
+        top_notes: List[str] = []
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            stats_future = executor.submit(self._get_repo_stats, url, stats_notes)
+            recent_future = executor.submit(self._get_recent_issues, url, recent_notes)
+            top_future = executor.submit(self._get_top_issues, url, top_notes)
+            summary = stats_future.result()
+            recent_issues = recent_future.result()
+            top_issues = top_future.result()
 
         return {
             "repository": repo_info,
-            "summary": main_stats,
-            "recent_issues": self._get_recent_issues(repo_info["url"]),
-            "top_issues": self._get_top_issues(repo_info["url"]),
+            "summary": summary,
+            "recent_issues": recent_issues,
+            "top_issues": top_issues,
+            "notes": notes + stats_notes + recent_notes + top_notes,
         }
 
-    def _get_repo_from_pypi(self, package_name: str) -> Dict[str, str]:
+    def _get_repo_from_pypi(
+        self, package_name: str, notes: List[str]
+    ) -> Dict[str, str]:
         """Get repository information from PyPI."""
         try:
-            response = requests.get(
-                f"https://pypi.org/pypi/{package_name}/json",
-                headers=self.headers,
-                timeout=10,
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = fetch_pypi_json(package_name, self.session)
 
             project_urls = data["info"].get("project_urls", {})
             for url_type, url in project_urls.items():
@@ -58,15 +77,15 @@ class IssueTracker:
             return {}
 
         except Exception as e:
-            self.console.print(f"[yellow]Error fetching from PyPI: {str(e)}[/yellow]")
+            notes.append(f"[yellow]Error fetching from PyPI: {str(e)}[/yellow]")
             return {}
 
-    def _get_repo_stats(self, repo_url: str) -> Dict[str, int]:
+    def _get_repo_stats(self, repo_url: str, notes: List[str]) -> Dict[str, int]:
         """Get repository statistics including issues and pull requests."""
         try:
-            response = requests.get(repo_url, headers=self.headers, timeout=10)
+            response = self.session.get(repo_url, timeout=10)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(response.content, "lxml")
 
             stats = {"open_issues": 0, "pull_requests": 0}
 
@@ -78,30 +97,30 @@ class IssueTracker:
             if pr_counter and "title" in pr_counter.attrs:
                 stats["pull_requests"] = int(pr_counter["title"])
 
-            self.console.print(
+            notes.append(
                 f"[green]Found {stats['open_issues']} open issues and {stats['pull_requests']} pull requests[/green]"
             )
             return stats
 
         except Exception as e:
-            self.console.print(
-                f"[yellow]Error getting repository stats: {str(e)}[/yellow]"
-            )
+            notes.append(f"[yellow]Error getting repository stats: {str(e)}[/yellow]")
             return {"open_issues": 0, "pull_requests": 0}
 
-    def _get_recent_issues(self, repo_url: str) -> List[Dict[str, Any]]:
+    def _get_recent_issues(
+        self, repo_url: str, notes: List[str]
+    ) -> List[Dict[str, Any]]:
         """Get recent issues from repository."""
         try:
             issues_url = f"{repo_url}/issues"
-            response = requests.get(issues_url, headers=self.headers, timeout=10)
+            response = self.session.get(issues_url, timeout=10)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(response.content, "lxml")
 
             issues = []
-            issue_rows = soup.find_all("div", {"class": re.compile(r"IssueRow-.*")})
+            issue_rows = soup.find_all("div", {"class": _ISSUE_ROW_RE}, limit=5)
 
-            for row in issue_rows[:5]:
-                title_elem = row.find("h3", {"class": re.compile(r"markdown-title.*")})
+            for row in issue_rows:
+                title_elem = row.find("h3", {"class": _MARKDOWN_TITLE_RE})
                 if not title_elem:
                     continue
 
@@ -120,24 +139,22 @@ class IssueTracker:
             return issues
 
         except Exception as e:
-            self.console.print(
-                f"[yellow]Error getting recent issues: {str(e)}[/yellow]"
-            )
+            notes.append(f"[yellow]Error getting recent issues: {str(e)}[/yellow]")
             return []
 
-    def _get_top_issues(self, repo_url: str) -> List[Dict[str, Any]]:
+    def _get_top_issues(self, repo_url: str, notes: List[str]) -> List[Dict[str, Any]]:
         """Get most discussed issues."""
         try:
             issues_url = f"{repo_url}/issues?q=is:issue&sort=comments"
-            response = requests.get(issues_url, headers=self.headers, timeout=10)
+            response = self.session.get(issues_url, timeout=10)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(response.content, "lxml")
 
             top_issues = []
-            issue_rows = soup.find_all("div", {"class": re.compile(r"IssueRow-.*")})
+            issue_rows = soup.find_all("div", {"class": _ISSUE_ROW_RE}, limit=5)
 
-            for row in issue_rows[:5]:
-                title_elem = row.find("h3", {"class": re.compile(r"markdown-title.*")})
+            for row in issue_rows:
+                title_elem = row.find("h3", {"class": _MARKDOWN_TITLE_RE})
                 if not title_elem:
                     continue
 
@@ -156,7 +173,7 @@ class IssueTracker:
             return top_issues
 
         except Exception as e:
-            self.console.print(f"[yellow]Error getting top issues: {str(e)}[/yellow]")
+            notes.append(f"[yellow]Error getting top issues: {str(e)}[/yellow]")
             return []
 
 
@@ -164,6 +181,9 @@ def display_issue_analysis(data: Dict[str, Any]) -> None:
     """Display the issue analysis results."""
     console = Console()
 
+    for note in data.get("notes", []):
+        console.print(note)
+
     if "error" in data:
         console.print(f"\n[red]Error: {data['error']}[/red]")
         return
@@ -1,6 +1,7 @@
-import requests
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from ._http import SESSION, fetch_pypi_json
 
 
 def fetch_package_info(
@@ -16,19 +17,18 @@ def fetch_package_info(
     Returns:
         Dict containing package information
     """
-    api_data = _fetch_api_data(package_name, version)
-
-    web_data = _scrape_pypi_page(package_name, version)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        api_future = executor.submit(_fetch_api_data, package_name, version)
+        web_future = executor.submit(_scrape_pypi_page, package_name, version)
+        api_data = api_future.result()
+        web_data = web_future.result()
 
     return {**api_data, **web_data}
 
 
 def _fetch_api_data(package_name: str, version: Optional[str] = None) -> Dict[str, Any]:
     """Fetch basic package information from PyPI JSON API."""
-    url = f"https://pypi.org/pypi/{package_name}/json"
-    response = requests.get(url)
-    response.raise_for_status()
-    data = response.json()
+    data = fetch_pypi_json(package_name)
 
     info = data["info"]
     return {
@@ -52,59 +52,51 @@ def _scrape_pypi_page(
     if version:
         url += f"/{version}"
 
-    response = requests.get(url)
+    response = SESSION.get(url)
     response.raise_for_status()
-    soup = BeautifulSoup(response.text, "html.parser")
+    tree = LexborHTMLParser(response.content)
 
     return {
-        "installation_guide": _extract_installation_guide(soup),
-        "latest_releases": _extract_latest_releases(soup),
-        "project_stats": _extract_project_stats(soup),
-        "community_info": _extract_community_info(soup),
+        "installation_guide": _extract_installation_guide(tree),
+        "latest_releases": _extract_latest_releases(tree),
+        "project_stats": _extract_project_stats(tree),
+        "community_info": _extract_community_info(tree),
     }
 
 
-def _extract_installation_guide(soup: BeautifulSoup) -> str:
+def _extract_installation_guide(tree: LexborHTMLParser) -> str:
     """Extract installation instructions."""
-    install_div = soup.find("span", {"class": "package-header__pip-instructions"})
-    return install_div.text.strip() if install_div else "pip install {package_name}"
+    install_div = tree.css_first("span.package-header__pip-instructions")
+    return install_div.text().strip() if install_div else "pip install {package_name}"
 
 
-def _extract_latest_releases(soup: BeautifulSoup) -> list:
+def _extract_latest_releases(tree: LexborHTMLParser) -> list:
     """Extract recent release information."""
-    releases = []
-    release_divs = soup.find_all("a", {"class": "release__card"})
-    for release in release_divs[:5]:
-        version = release.find("p", {"class": "release__version"})
-        if version:
-            releases.append(version.text.strip())
-    return releases
+    versions = tree.css("a.release__card p.release__version")
+    return [version.text().strip() for version in versions[:5]]
 
 
-def _extract_project_stats(soup: BeautifulSoup) -> Dict[str, str]:
+def _extract_project_stats(tree: LexborHTMLParser) -> Dict[str, str]:
     """Extract project statistics."""
     stats = {}
-    stats_div = soup.find("div", {"class": "package-header__stats"})
+    stats_div = tree.css_first("div.package-header__stats")
     if stats_div:
-        for stat in stats_div.find_all("p"):
-            name = stat.find("span", {"class": "package-header__stat-name"})
-            value = stat.find("span", {"class": "package-header__stat-value"})
+        for stat in stats_div.css("p"):
+            name = stat.css_first("span.package-header__stat-name")
+            value = stat.css_first("span.package-header__stat-value")
             if name and value:
-                stats[name.text.strip()] = value.text.strip()
+                stats[name.text().strip()] = value.text().strip()
     return stats
 
 
-def _extract_community_info(soup: BeautifulSoup) -> Dict[str, Any]:
+def _extract_community_info(tree: LexborHTMLParser) -> Dict[str, Any]:
     """Extract community-related information."""
     info = {}
 
     maintainers = []
-    maintainers_div = soup.find("div", {"class": "maintainers"})
+    maintainers_div = tree.css_first("div.maintainers")
     if maintainers_div:
-        maintainers = [
-            m.text.strip()
-            for m in maintainers_div.find_all("span", {"class": "maintainer"})
-        ]
+        maintainers = [m.text().strip() for m in maintainers_div.css("span.maintainer")]
     info["maintainers"] = maintainers
 
     return info
@@ -112,13 +104,7 @@ def _extract_community_info(soup: BeautifulSoup) -> Dict[str, Any]:
 
 def _extract_dependencies(data: Dict[str, Any], version: Optional[str] = None) -> list:
     """Extract package dependencies."""
-    if version and version in data.get("releases", {}):
-        release_data = data["releases"][version]
-    else:
-        version = data["info"]["version"]
-        release_data = data["releases"].get(version, [])
-
     requires_dist = data["info"].get("requires_dist", [])
     if requires_dist:
-        return [dep.split(";")[0].strip() for dep in requires_dist if dep]
+        return [dep.partition(";")[0].strip() for dep in requires_dist if dep]
     return []
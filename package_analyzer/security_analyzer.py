@@ -1,37 +1,66 @@
+import ahocorasick
+import orjson
 import requests
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from packaging import version
 import re
+from ._http import SESSION
+
+_SECURITY_CRITICAL_PACKAGES = frozenset(
+    {
+        "cryptography",
+        "django",
+        "flask",
+        "requests",
+        "urllib3",
+        "pyopenssl",
+        "paramiko",
+        "pyjwt",
+        "python-jose",
+    }
+)
+_CRITICAL_KEYWORDS = frozenset(
+    {
+        "remote code execution",
+        "rce",
+        "arbitrary code",
+        "sql injection",
+        "authentication bypass",
+        "privilege escalation",
+        "buffer overflow",
+        "memory corruption",
+        "denial of service",
+        "information disclosure",
+        "path traversal",
+        "xss",
+    }
+)
+_CRYPTO_KEYWORDS = frozenset({"cryptographic", "encryption", "authentication"})
+# OSV rejects querybatch requests with more than this many queries.
+_OSV_BATCH_LIMIT = 1000
+
+
+def _build_keyword_automaton() -> ahocorasick.Automaton:
+    """Index all severity keywords so a description is scanned only once."""
+    automaton = ahocorasick.Automaton()
+    for keyword in _CRITICAL_KEYWORDS:
+        automaton.add_word(keyword, (keyword, "critical"))
+    for keyword in _CRYPTO_KEYWORDS:
+        automaton.add_word(keyword, (keyword, "crypto"))
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
 
 
 class SecurityAnalyzer:
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None):
+        self.session = session or SESSION
         self.osv_api_url = "https://api.osv.dev/v1/query"
-        self.security_critical_packages = {
-            "cryptography",
-            "django",
-            "flask",
-            "requests",
-            "urllib3",
-            "pyopenssl",
-            "paramiko",
-            "pyjwt",
-            "python-jose",
-        }
-        self.critical_keywords = {
-            "remote code execution",
-            "rce",
-            "arbitrary code",
-            "sql injection",
-            "authentication bypass",
-            "privilege escalation",
-            "buffer overflow",
-            "memory corruption",
-            "denial of service",
-            "information disclosure",
-            "path traversal",
-            "xss",
-        }
+        self.osv_batch_url = "https://api.osv.dev/v1/querybatch"
+        self.osv_vuln_url = "https://api.osv.dev/v1/vulns"
 
     def analyze_package(
         self, package_name: str, package_version: Optional[str] = None
@@ -41,20 +70,107 @@ class SecurityAnalyzer:
             vulnerabilities, package_name, package_version
         )
 
-    def _fetch_vulnerabilities(
+    def analyze_packages(
+        self, packages: List[Tuple[str, Optional[str]]]
+    ) -> Dict[Tuple[str, Optional[str]], Dict[str, Any]]:
+        """
+        Analyze several (name, version) pairs with batched OSV queries.
+
+        Not wired into the CLI yet; ``--security`` still uses
+        ``analyze_package``.
+        """
+        batch_results = self._fetch_vulnerabilities_batch(packages)
+        return {
+            (package_name, package_version): self._process_vulnerabilities(
+                vulnerabilities, package_name, package_version
+            )
+            for (package_name, package_version), vulnerabilities in zip(
+                packages, batch_results
+            )
+        }
+
+    def _build_query(
         self, package_name: str, package_version: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
+    ) -> Dict[str, Any]:
         query = {"package": {"name": package_name, "ecosystem": "PyPI"}}
         if package_version:
             query["version"] = package_version
+        return query
+
+    def _fetch_vulnerabilities(
+        self, package_name: str, package_version: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        query = self._build_query(package_name, package_version)
 
         try:
-            response = requests.post(self.osv_api_url, json=query)
+            response = self.session.post(self.osv_api_url, json=query)
             response.raise_for_status()
-            return response.json().get("vulns", [])
-        except requests.exceptions.RequestException as e:
+            return orjson.loads(response.content).get("vulns", [])
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            raise Exception(f"Failed to fetch security data: {str(e)}")
+
+    def _fetch_vulnerabilities_batch(
+        self, packages: List[Tuple[str, Optional[str]]]
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Fetch vulnerabilities for many packages in as few OSV round trips as possible.
+
+        Queries are sent in chunks of at most ``_OSV_BATCH_LIMIT``, and results
+        carrying a ``next_page_token`` are queried again until exhausted. The
+        batch endpoint only returns vulnerability IDs, so the full records are
+        fetched afterwards, once per distinct ID and in parallel. The returned
+        list is aligned with ``packages``.
+        """
+        vuln_ids_per_query: List[List[str]] = [[] for _ in packages]
+        pending = [
+            (index, self._build_query(name, version))
+            for index, (name, version) in enumerate(packages)
+        ]
+
+        try:
+            while pending:
+                next_pending = []
+                for start in range(0, len(pending), _OSV_BATCH_LIMIT):
+                    chunk = pending[start : start + _OSV_BATCH_LIMIT]
+                    response = self.session.post(
+                        self.osv_batch_url,
+                        json={"queries": [query for _, query in chunk]},
+                        timeout=10,
+                    )
+                    response.raise_for_status()
+                    results = orjson.loads(response.content).get("results", [])
+
+                    for (index, query), result in zip(chunk, results):
+                        vuln_ids_per_query[index].extend(
+                            vuln["id"] for vuln in result.get("vulns", [])
+                        )
+                        page_token = result.get("next_page_token")
+                        if page_token:
+                            next_pending.append(
+                                (index, {**query, "page_token": page_token})
+                            )
+                pending = next_pending
+
+            vuln_ids = sorted(
+                {vuln_id for ids in vuln_ids_per_query for vuln_id in ids}
+            )
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                details = dict(
+                    zip(vuln_ids, executor.map(self._fetch_vulnerability, vuln_ids))
+                )
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             raise Exception(f"Failed to fetch security data: {str(e)}")
 
+        return [
+            [details[vuln_id] for vuln_id in dict.fromkeys(ids)]
+            for ids in vuln_ids_per_query
+        ]
+
+    def _fetch_vulnerability(self, vuln_id: str) -> Dict[str, Any]:
+        response = self.session.get(f"{self.osv_vuln_url}/{vuln_id}", timeout=10)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
     def _determine_severity(
         self, vulnerability: Dict[str, Any], package_name: str
     ) -> str:
@@ -71,21 +187,18 @@ class SecurityAnalyzer:
                     pass
 
         description = (
-            vulnerability.get("summary", "").lower()
-            + str(vulnerability.get("details", "")).lower()
-        )
+            f"{vulnerability.get('summary', '')} {vulnerability.get('details', '')}"
+        ).lower()
+
+        matches = {match for _, match in _KEYWORD_AUTOMATON.iter(description)}
+        groups = [group for _, group in matches]
 
-        for keyword in self.critical_keywords:
-            if keyword in description:
-                severity_score += 2
+        severity_score += 2 * groups.count("critical")
 
-        if package_name.lower() in self.security_critical_packages:
+        if package_name.lower() in _SECURITY_CRITICAL_PACKAGES:
             severity_score += 1
 
-        if any(
-            kw in description
-            for kw in ["cryptographic", "encryption", "authentication"]
-        ):
+        if "crypto" in groups:
             severity_score += 1.5
 
         affected = vulnerability.get("affected", [])
@@ -115,6 +228,7 @@ class SecurityAnalyzer:
             "severity_counts": {"CRITICAL": 0, "HIGH": 0, "MEDIUM": 0, "LOW": 0},
             "vulnerabilities": [],
         }
+        buckets = {"CRITICAL": [], "HIGH": [], "MEDIUM": [], "LOW": []}
 
         for vuln in vulnerabilities:
             severity = self._determine_severity(vuln, package_name)
@@ -141,11 +255,10 @@ class SecurityAnalyzer:
                 ),
             }
 
-            processed_data["vulnerabilities"].append(vuln_info)
+            buckets[severity].append(vuln_info)
 
-        severity_order = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3}
-        processed_data["vulnerabilities"].sort(
-            key=lambda x: severity_order[x["severity"]]
+        processed_data["vulnerabilities"] = (
+            buckets["CRITICAL"] + buckets["HIGH"] + buckets["MEDIUM"] + buckets["LOW"]
         )
 
         return processed_data
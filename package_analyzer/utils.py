@@ -1,15 +1,21 @@
-import json
+import orjson
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.text import Text
 from typing import Dict, Any
 
 console = Console()
 
+_SEVERITY_COLORS = {
+    "CRITICAL": "red",
+    "HIGH": "yellow",
+    "MEDIUM": "magenta",
+    "LOW": "blue",
+}
+
 
 def display_table(data: Dict[str, Any]):
     """Display package information in a formatted table."""
+    from rich.table import Table
+
     console.print(f"\nPackage: {data['name']}\n")
 
     # Basic Information Table
@@ -42,18 +48,17 @@ def display_table(data: Dict[str, Any]):
 
 def display_security_report(security_data: Dict[str, Any]):
     """Display security analysis results."""
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
     summary = Text()
     summary.append(
         f"Total Vulnerabilities: {security_data['total_vulnerabilities']}\n\n"
     )
     summary.append("Severity Breakdown:\n")
     for severity, count in security_data["severity_counts"].items():
-        color = {
-            "CRITICAL": "red",
-            "HIGH": "yellow",
-            "MEDIUM": "magenta",
-            "LOW": "blue",
-        }.get(severity, "white")
+        color = _SEVERITY_COLORS.get(severity, "white")
         summary.append(f"{severity}: ", style=color)
         summary.append(f"{count}\n")
 
@@ -67,12 +72,7 @@ def display_security_report(security_data: Dict[str, Any]):
         vuln_table.add_column("Fixed Versions", style="green")
 
         for vuln in security_data["vulnerabilities"]:
-            severity_style = {
-                "CRITICAL": "red",
-                "HIGH": "yellow",
-                "MEDIUM": "magenta",
-                "LOW": "blue",
-            }.get(vuln["severity"], "white")
+            severity_style = _SEVERITY_COLORS.get(vuln["severity"], "white")
 
             fixed_versions = (
                 ", ".join(vuln["fixed_versions"])
@@ -94,12 +94,12 @@ def display_security_report(security_data: Dict[str, Any]):
 
 def display_json(data: Dict[str, Any]):
     """Display package information as JSON."""
-    console.print_json(json.dumps(data, indent=2))
+    console.print_json(data=data)
 
 
 def save_results(data: Dict[str, Any], package_name: str):
     """Save the analysis results to a file."""
     filename = f"{package_name}_analysis.json"
-    with open(filename, "w") as f:
-        json.dump(data, f, indent=2)
+    with open(filename, "wb") as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
     console.print(f"\n[green]Results saved to {filename}[/green]")
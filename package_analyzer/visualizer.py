@@ -1,16 +1,116 @@
 from graphviz import Digraph
+from packaging.markers import InvalidMarker, Marker, UndefinedEnvironmentName
+from packaging.utils import canonicalize_name
 import requests
-from typing import Dict, Set, Any
-import json
-
+from typing import Callable, Dict, List, Set, Tuple, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import hashlib
+import orjson
+import os
+import re
+import shutil
+from ._http import fetch_pypi_json, write_cache_file
+
+# Upper bound on concurrent requests to PyPI; keep it within the shared
+# session's per-host connection pool.
+_MAX_WORKERS = 16
+# Dependency metadata up to a day old is reused without asking PyPI.
+_CACHE_TTL = 24 * 60 * 60
+_RENDER_CACHE_DIR = os.path.expanduser("~/.cache/package-analyzer/renders")
+# Leading distribution name of a PEP 508 requirement, e.g. "foo" in
+# 'foo[extra] (>=1.0); python_version < "3.11"'.
+_REQ_RE = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)")
+
+
+def fetch_package_info(pkg_name: str) -> Dict[str, Any]:
+    """Fetch the parts of a package's PyPI metadata that the graph needs."""
+    info = fetch_pypi_json(pkg_name, max_age=_CACHE_TTL)["info"]
+    return {
+        "info": {
+            "version": info.get("version"),
+            "requires_dist": info.get("requires_dist") or [],
+        }
+    }
+
+
+def _try_fetch_package_info(pkg_name: str) -> Optional[Dict[str, Any]]:
+    try:
+        return fetch_package_info(pkg_name)
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError):
+        return None
+
+
+def _name_of(req: str) -> Optional[str]:
+    match = _REQ_RE.match(req)
+    return match.group(1) if match else None
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_marker(marker_text: str) -> Optional[Marker]:
+    try:
+        return Marker(marker_text)
+    except InvalidMarker:
+        return None
+
+
+def _marker_applies(marker_text: str, environment: Optional[Dict[str, str]]) -> bool:
+    # Requirements whose marker cannot be understood are kept rather than
+    # silently dropped from the graph.
+    marker = _parse_marker(marker_text)
+    if marker is None:
+        return True
+    try:
+        return marker.evaluate(environment)
+    except UndefinedEnvironmentName:
+        return True
+
+
+def parse_requires(
+    data: Dict[str, Any], environment: Optional[Dict[str, str]] = None
+) -> List[str]:
+    """
+    Return the distinct distribution names listed in ``requires_dist``.
 
-def create_dependency_graph(package_name: str, max_depth: int = 2) -> Digraph:
+    Requirements gated by an environment marker that does not hold for
+    ``environment`` (the running interpreter when omitted) are skipped, as are
+    optional extras.
+    """
+    names = []
+    for req in data["info"].get("requires_dist") or []:
+        if not req:
+            continue
+        spec, _, marker_text = req.partition(";")
+        marker_text = marker_text.strip()
+        if marker_text and not _marker_applies(marker_text, environment):
+            continue
+        name = _name_of(spec)
+        if name:
+            names.append(name)
+    return list(dict.fromkeys(names))
+
+
+def create_dependency_graph(
+    package_name: str,
+    max_depth: int = 2,
+    max_nodes: int = 200,
+    target_env: Optional[Dict[str, str]] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+) -> Digraph:
     """
     Create a dependency graph for the specified package.
 
+    Packages are explored breadth-first and every package of a level is
+    fetched from PyPI concurrently, so a level costs roughly one round trip.
+
     Args:
         package_name: Name of the package to analyze
         max_depth: Maximum depth of dependencies to analyze
+        max_nodes: Maximum number of packages to fetch and expand
+        target_env: PEP 508 marker environment to resolve dependencies for,
+            e.g. {"sys_platform": "win32"}; defaults to the running interpreter
+        progress_callback: Called after each level with the number of packages
+            fetched so far and the number queued for the next level
 
     Returns:
         Graphviz Digraph object
@@ -20,46 +120,87 @@ def create_dependency_graph(package_name: str, max_depth: int = 2) -> Digraph:
 
     dot.attr("node", shape="box", style="rounded,filled", fillcolor="lightblue")
 
-    visited = set()
-
-    def fetch_package_info(pkg_name: str) -> Dict[str, Any]:
-        response = requests.get(f"https://pypi.org/pypi/{pkg_name}/json")
-        response.raise_for_status()
-        return response.json()
-
-    def add_dependencies(pkg_name: str, current_depth: int = 0):
-        if current_depth >= max_depth or pkg_name in visited:
-            return
-
-        visited.add(pkg_name)
-
-        try:
-            data = fetch_package_info(pkg_name)
-            requires_dist = data["info"].get("requires_dist", [])
-
-            dot.node(pkg_name, f"{pkg_name}\n{data['info'].get('version', 'unknown')}")
-
-            if requires_dist:
-                for dep in requires_dist:
-                    if dep:
-
-                        dep_name = dep.split(" ")[0].split(";")[0].strip()
-                        if dep_name:
-
-                            dot.edge(pkg_name, dep_name)
-                            if dep_name not in visited:
-                                add_dependencies(dep_name, current_depth + 1)
-
-        except requests.exceptions.RequestException:
-
-            dot.node(pkg_name, pkg_name, fillcolor="lightgray")
+    # Graph nodes are keyed by PEP 503 canonical name so "Flask", "flask" and
+    # "FLASK" collapse into one node; the first spelling seen is displayed.
+    root = canonicalize_name(package_name)
+    display_names: Dict[str, str] = {root: package_name}
+    visited: Set[str] = set()
+    nodes: Dict[str, Dict[str, str]] = {}
+    edges: Set[Tuple[str, str]] = set()
+    frontier = [root]
+    # Packages within the depth budget that max_nodes kept from being expanded.
+    dropped: Set[str] = set()
+
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+        for depth in range(max_depth):
+            frontier = [
+                pkg_id for pkg_id in dict.fromkeys(frontier) if pkg_id not in visited
+            ]
+            remaining = max(max_nodes - len(visited), 0)
+            if len(frontier) > remaining:
+                dropped.update(frontier[remaining:])
+                frontier = frontier[:remaining]
+            if not frontier:
+                break
+            visited.update(frontier)
+
+            next_frontier = []
+            results = executor.map(_try_fetch_package_info, frontier)
+            for pkg_id, data in zip(frontier, results):
+                label = display_names[pkg_id]
+                if data is None:
+                    nodes[pkg_id] = {"label": label, "fillcolor": "lightgray"}
+                    continue
+
+                version = data["info"].get("version", "unknown")
+                nodes[pkg_id] = {"label": f"{label}\n{version}"}
+
+                for dep_name in parse_requires(data, target_env):
+                    dep_id = canonicalize_name(dep_name)
+                    display_names.setdefault(dep_id, dep_name)
+                    edges.add((pkg_id, dep_id))
+                    next_frontier.append(dep_id)
+
+            frontier = next_frontier
+            if dropped and depth + 1 < max_depth:
+                # The traversal stops here, so the next level is cut as well.
+                dropped.update(name for name in frontier if name not in visited)
+            if progress_callback is not None:
+                # Nothing more is fetched past the last level or a truncation.
+                if dropped or depth == max_depth - 1:
+                    queued = 0
+                else:
+                    queued = len({name for name in frontier if name not in visited})
+                progress_callback(len(visited), queued)
+            if dropped:
+                break
+
+    # Emit each node and edge exactly once, in a stable order, so the DOT
+    # source is minimal and identical for identical inputs.
+    for pkg_id in sorted(nodes):
+        dot.node(pkg_id, **nodes[pkg_id])
+    for pkg_id in sorted({head for _, head in edges} - nodes.keys()):
+        dot.node(pkg_id, display_names[pkg_id])
+    for tail, head in sorted(edges):
+        dot.edge(tail, head)
+    if dropped:
+        dot.node(
+            "__truncated__",
+            f"… {len(dropped)} more not expanded",
+            style="dashed",
+            fillcolor="white",
+        )
 
-    add_dependencies(package_name)
     return dot
 
 
 def save_dependency_graph(
-    package_name: str, max_depth: int = 2, output_format: str = "png"
+    package_name: str,
+    max_depth: int = 2,
+    output_format: str = "png",
+    max_nodes: int = 200,
+    target_env: Optional[Dict[str, str]] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
 ) -> str:
     """
     Generate and save the dependency graph.
@@ -68,11 +209,31 @@ def save_dependency_graph(
         package_name: Name of the package to analyze
         max_depth: Maximum depth of dependencies to analyze
         output_format: Output file format (pdf, png, svg)
+        max_nodes: Maximum number of packages to fetch and expand; the graph
+            gets a "… N more" marker when this limit cuts the traversal short
+        target_env: PEP 508 marker environment to resolve dependencies for
+        progress_callback: Called after each level with (fetched, queued) counts
 
     Returns:
         Path to the generated graph file
     """
-    graph = create_dependency_graph(package_name, max_depth)
-    filename = f"{package_name}_dependencies"
-    graph.render(filename, format=output_format, cleanup=True)
-    return f"{filename}.{output_format}"
+    graph = create_dependency_graph(
+        package_name, max_depth, max_nodes, target_env, progress_callback
+    )
+    output_path = f"{package_name}_dependencies.{output_format}"
+
+    # Rendering shells out to the dot binary, so identical graphs are only
+    # rendered once and then copied from the cache.
+    key = hashlib.blake2b(graph.source.encode(), digest_size=16).hexdigest()
+    cached_path = os.path.join(_RENDER_CACHE_DIR, f"{key}.{output_format}")
+    if os.path.exists(cached_path):
+        shutil.copyfile(cached_path, output_path)
+        return output_path
+
+    rendered = graph.pipe(format=output_format)
+    with open(output_path, "wb") as f:
+        f.write(rendered)
+
+    write_cache_file(cached_path, rendered)
+
+    return output_path